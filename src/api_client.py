@@ -1,11 +1,13 @@
 import logging
-from typing import Any
+import time
+from typing import Any, Callable, TypeVar
 import requests
 from base64 import b64encode
 import os
 from dotenv import load_dotenv
 from ruamel.yaml import YAML
 
+from data_node.github_language_data_node import GithubLanguageDataNode
 from exception.WakatimeCredentialsMissingError import WakatimeCredentialsMissingError
 
 log = logging.getLogger(__name__)
@@ -13,8 +15,26 @@ log.setLevel(logging.DEBUG)
 
 _ = load_dotenv()
 
+LAST_7_DAYS_TTL_SECONDS: int = 2 * 60
+GITHUB_LANGUAGES_TTL_SECONDS: int = 24 * 60 * 60
 
-def get_last_7_days_data() -> dict[str, dict[str, Any] | list[dict[str, Any]]]:
+T = TypeVar("T")
+
+# key -> (time of the fetch, fetched data)
+_cache: dict[str, tuple[float, Any]] = {}
+
+
+def get_last_7_days_data(
+    refresh: bool = False,
+) -> dict[str, dict[str, Any] | list[dict[str, Any]]]:
+    # every command needs the same stats, so commands sent close to each other
+    # share a single request
+    return _get_cached(
+        "last_7_days", LAST_7_DAYS_TTL_SECONDS, _fetch_last_7_days_data, refresh
+    )
+
+
+def _fetch_last_7_days_data() -> dict[str, dict[str, Any] | list[dict[str, Any]]]:
     base_url: str | None = os.getenv("WAKATIME_BASE_URL")
     api_key: str | None = os.getenv("WAKATIME_API_KEY")
     user: str | None = os.getenv("WAKATIME_USER")
@@ -52,7 +72,32 @@ def get_last_7_days_data() -> dict[str, dict[str, Any] | list[dict[str, Any]]]:
     return response.json()["data"]
 
 
-def get_github_languages_info() -> list[dict[str, Any]]:
+def get_github_language_colors(refresh: bool = False) -> dict[str, str]:
+    # languages.yml changes rarely, so it's refetched only once a day
+    return _get_cached(
+        "github_language_colors",
+        GITHUB_LANGUAGES_TTL_SECONDS,
+        _fetch_github_language_colors,
+        refresh,
+    )
+
+
+def _fetch_github_language_colors() -> dict[str, str]:
+    # keyed by lowercased name, so consumers can look colors up directly
+    colors: dict[str, str] = {}
+
+    for language in _fetch_github_languages_info():
+        language_node = GithubLanguageDataNode(language)
+        _ = colors.setdefault(language_node.name_lower, language_node.color)
+
+    # languages missing in the github-linguist, github colors take precedence
+    _ = colors.setdefault("vue.js", "#41b883")
+    _ = colors.setdefault("bash", "#89e051")
+
+    return colors
+
+
+def _fetch_github_languages_info() -> list[dict[str, Any]]:
     url = "https://raw.githubusercontent.com/github-linguist/linguist/master/lib/linguist/languages.yml"
 
     log.info("Requesting languages.yml from the github-linguist")
@@ -73,5 +118,19 @@ def get_github_languages_info() -> list[dict[str, Any]]:
     return languages_data
 
 
+def _get_cached(key: str, ttl: float, fetch: Callable[[], T], refresh: bool) -> T:
+    now = time.monotonic()
+    cached = _cache.get(key)
+
+    if not refresh and cached is not None and now - cached[0] < ttl:
+        log.debug(f"Using cached {key}")
+        return cached[1]
+
+    data = fetch()
+    _cache[key] = (now, data)
+
+    return data
+
+
 if __name__ == "__main__":
     log.info("This should not be run as a module")
@@ -1,6 +1,7 @@
 class WakatimeDataNode:
     total_seconds: int
     name: str
+    name_lower: str
     percent: float
     digital: str
     decimal: str
@@ -11,6 +12,7 @@ class WakatimeDataNode:
     def __init__(self, raw_data: dict[str, str | float | int]) -> None:
         self.total_seconds = int(raw_data.get("total_seconds", 0))
         self.name = str(raw_data.get("name", "unknown"))
+        self.name_lower = self.name.lower()
         self.percent = float(raw_data.get("percent", 0))
         self.digital = str(raw_data.get("digital", "unknown"))
         self.decimal = str(raw_data.get("decimal", "unknown"))
@@ -1,23 +1,49 @@
 import logging
+import os
 from uuid import UUID
 import matplotlib
-import matplotlib.pyplot as plt
+import matplotlib.font_manager
+from dotenv import load_dotenv
+from PIL import Image, ImageDraw, ImageFont
 
-from data_node.github_language_data_node import GithubLanguageDataNode
 from data_node.wakatime_data_node import WakatimeDataNode
-from image_manager import save_plot
+from image_manager import save_image, save_plot
 
-matplotlib.use("TkAgg")
+# headless backend, bot hosts have no display
+matplotlib.use("Agg", force=True)
 custom_font = {
     "font.family": "sans-serif",
-    "font.serif": ["Segoe UI"],
+    "font.sans-serif": ["Segoe UI", *matplotlib.rcParams["font.sans-serif"]],
 }
 
 matplotlib.rcParams.update(custom_font)
 
+# same font chain as the matplotlib renderer, pillow's bundled font is latin only
+PILLOW_FONT = ImageFont.truetype(
+    matplotlib.font_manager.findfont(
+        matplotlib.font_manager.FontProperties(family=["sans-serif"])
+    ),
+    14,
+)
+
 GITHUB_BG_COLOR: str = "#0D1117"
 GITHUB_FG_COLOR: str = "#C3D1D9"
 
+# registry lookup doesn't need pyplot, which only the matplotlib renderer imports
+DEFAULT_COLORS = matplotlib.colormaps["tab10"]
+
+# number of items shown on the chart
+CHART_ITEMS_LIMIT: int = 5
+
+# size of the default matplotlib figure, 6.4x4.8 inches at 100 dpi
+CHART_WIDTH: int = 640
+CHART_HEIGHT: int = 480
+
+_ = load_dotenv()
+
+# "pillow" draws the chart directly, "matplotlib" is kept as a fallback
+CHART_RENDERER: str = os.getenv("CHART_RENDERER", "pillow")
+
 log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
@@ -25,28 +51,69 @@ log.setLevel(logging.DEBUG)
 def create_pie_chart(
     data_list: list[WakatimeDataNode],
     uuid: UUID,
-    langs_data: list[GithubLanguageDataNode] | None = None,
+    colors: list[str | tuple[float, ...]] | None = None,
 ) -> None:
     log.info(f"Creating pie chart for uuid - {uuid}")
-    box, (left_plot, right_plot) = plt.subplots(1, 2)
 
-    percents: list[float] = [data.percent for data in data_list[:5]]
-    names: list[str] = [data.name for data in data_list[:5]]
-    hours: list[str] = [data.text for data in data_list[:5]]
+    top_data = data_list[:CHART_ITEMS_LIMIT]
+
+    # collecting pie values and left side legend in a single pass
+    percents: list[float] = []
+    labels: list[str] = []
+    for data in top_data:
+        percents.append(data.percent)
+        labels.append(f"{data.name} {data.percent}% - {data.text}")
+
+    if CHART_RENDERER == "matplotlib":
+        _create_pie_chart_matplotlib(percents, colors, labels, uuid)
+        return
+
+    # pillow can't use matplotlib's default color cycle, so fill it in here
+    if colors is None:
+        colors = [DEFAULT_COLORS(index) for index in range(len(percents))]
+
+    image = _render_pie_pillow(
+        percents,
+        colors,
+        labels,
+        CHART_WIDTH,
+        CHART_HEIGHT,
+        GITHUB_BG_COLOR,
+        GITHUB_FG_COLOR,
+    )
+
+    save_image(image, uuid)
+
+
+def get_colors(
+    langs_colors: dict[str, str] | None,
+    data_list: list[WakatimeDataNode],
+) -> list[str | tuple[float, ...]] | None:
+    if langs_colors is None:
+        return None
+
+    # use default colors for missing langs
+    return [
+        langs_colors.get(data.name_lower) or DEFAULT_COLORS(index)
+        for index, data in enumerate(data_list[:CHART_ITEMS_LIMIT])
+    ]
+
 
-    colors = _get_colors(langs_data, names)
+def _create_pie_chart_matplotlib(
+    percents: list[float],
+    colors: list[str | tuple[float, ...]] | None,
+    labels: list[str],
+    uuid: UUID,
+) -> None:
+    import matplotlib.pyplot as plt
+
+    box, (left_plot, right_plot) = plt.subplots(1, 2)
 
     # creating pie based on percents, shape it with wedgeprops
     wedges, autotext = right_plot.pie(
         percents, colors=colors, wedgeprops=dict(width=0.2, radius=0.95)
     )
 
-    # building left side legend
-    labels = [
-        f"{name} {percent}% - {hour}"
-        for name, percent, hour in zip(names, percents, hours)
-    ]
-
     # hiding legend text on the pie
     for text in autotext:
         text.set_alpha(0)
@@ -63,27 +130,83 @@ def create_pie_chart(
 
     save_plot(box, uuid)
 
+    # pyplot keeps every figure alive until it's closed
+    plt.close(box)
+
+
+def _render_pie_pillow(
+    percents: list[float],
+    colors: list[str | tuple[float, ...]],
+    labels: list[str],
+    width: int,
+    height: int,
+    bg: str,
+    fg: str,
+) -> Image.Image:
+    image = Image.new("RGB", (width, height), bg)
+    draw = ImageDraw.Draw(image)
+
+    # pie takes the right half, mirroring the 1x2 matplotlib subplots
+    center_x, center_y = width * 3 // 4, height // 2
+    outer_radius = int(min(width // 2, height) * 0.4)
+    inner_radius = int(outer_radius * 0.75 / 0.95)
+
+    # like matplotlib, slices start at 3 o'clock and go counterclockwise,
+    # pillow angles go clockwise so they're negated
+    total = sum(percents)
+    start = 0.0
+    for percent, color in zip(percents, colors):
+        end = start + percent / total * 360 if total else start
+        draw.pieslice(
+            (
+                center_x - outer_radius,
+                center_y - outer_radius,
+                center_x + outer_radius,
+                center_y + outer_radius,
+            ),
+            -end,
+            -start,
+            fill=_to_pillow_color(color),
+        )
+        start = end
+
+    # punching the hole to get the same look as wedgeprops width
+    draw.ellipse(
+        (
+            center_x - inner_radius,
+            center_y - inner_radius,
+            center_x + inner_radius,
+            center_y + inner_radius,
+        ),
+        fill=bg,
+    )
 
-def _get_colors(
-    github_langs_data: list[GithubLanguageDataNode] | None, languages: list[str]
-) -> list | None:
-    if github_langs_data is None:
-        return None
-
-    colors = []
-    defaultColors = plt.get_cmap("tab10")
-
-    for index, language in enumerate(languages):
-        found = False
-        for github_language in github_langs_data:
-
-            if github_language.name.lower() == language.lower():
-                _ = colors.append(github_language.color)
-                found = True
-                break
-
-        # use default colors for missing langs
-        if not found:
-            _ = colors.append(defaultColors(index))
+    # building left side legend, centered vertically
+    line_height = 24
+    marker_size = 12
+    legend_x = 24
+    legend_y = (height - line_height * len(labels)) // 2
+    for index, (label, color) in enumerate(zip(labels, colors)):
+        y = legend_y + index * line_height
+        draw.rectangle(
+            (legend_x, y, legend_x + marker_size, y + marker_size),
+            fill=_to_pillow_color(color),
+        )
+        draw.text(
+            (legend_x + marker_size * 2, y + marker_size // 2),
+            label,
+            fill=fg,
+            font=PILLOW_FONT,
+            anchor="lm",
+        )
+
+    return image
+
+
+def _to_pillow_color(color: str | tuple[float, ...]) -> str | tuple[int, ...]:
+    # matplotlib colormaps return RGBA floats in the 0..1 range
+    if isinstance(color, str):
+        return color
+
+    return tuple(round(channel * 255) for channel in color[:3])
 
-    return colors
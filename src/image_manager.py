@@ -1,8 +1,13 @@
 import datetime
 import logging
 import os
+from typing import TYPE_CHECKING
 from uuid import UUID
-from matplotlib.figure import Figure
+from PIL.Image import Image
+
+# only needed for the annotation, the pillow renderer shouldn't load matplotlib
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 PLOTS_DIRECTORY: str = "plots"
 DATE_SEPARATOR: str = "_"
@@ -11,13 +16,16 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
 
-def save_plot(figure: Figure, uuid: UUID):
+def save_plot(figure: "Figure", uuid: UUID):
     log.debug(f"Saving plot with uuid - {uuid}")
 
-    date = datetime.datetime.now()
-    date = date.strftime("%y-%m-%d")
+    figure.savefig(_get_plot_path(uuid))
+
+
+def save_image(image: Image, uuid: UUID):
+    log.debug(f"Saving image with uuid - {uuid}")
 
-    figure.savefig(f"{PLOTS_DIRECTORY}/{uuid}{DATE_SEPARATOR}{date}.png")
+    image.save(_get_plot_path(uuid), format="PNG", optimize=True)
 
 
 def find_by_uuid(uuid: UUID) -> str | None:
@@ -28,3 +36,10 @@ def find_by_uuid(uuid: UUID) -> str | None:
             return os.path.join(PLOTS_DIRECTORY, plot)
 
     return None
+
+
+def _get_plot_path(uuid: UUID) -> str:
+    date = datetime.datetime.now()
+    date = date.strftime("%y-%m-%d")
+
+    return f"{PLOTS_DIRECTORY}/{uuid}{DATE_SEPARATOR}{date}.png"
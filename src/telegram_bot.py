@@ -1,15 +1,17 @@
+import asyncio
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 from uuid import UUID, uuid4
 from dotenv import load_dotenv
 from telegram import Update
 from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler
 
-from api_client import get_github_languages_info, get_last_7_days_data
-from data_node.github_language_data_node import GithubLanguageDataNode
+from api_client import get_github_language_colors, get_last_7_days_data
 from data_node.wakatime_data_node import WakatimeDataNode
-from data_processor import create_pie_chart
+from data_processor import create_pie_chart, get_colors
 from exception.ChatIdMissingError import ChatIdMissingError
 from exception.PhotoMissingError import PhotoMissingError
 from exception.WakatimeCredentialsMissingError import WakatimeCredentialsMissingError
@@ -27,8 +29,14 @@ _ = load_dotenv()
 
 token = os.getenv("TELEGRAM_API_TOKEN")
 
+# charts are CPU-bound, rendering them in processes keeps them off the GIL,
+# the pool is created by initialize_bot so importing this module has no side effects
+chart_executor: ProcessPoolExecutor | None = None
+
 
 def initialize_bot():
+    global chart_executor
+
     log.info("Initializing bot")
 
     if token is None:
@@ -47,7 +55,17 @@ def initialize_bot():
     application.add_handler(editors_handler)
     application.add_handler(projects_handler)
 
-    application.run_polling()
+    # handlers run blocking calls in threads, forking a multi-threaded process
+    # can deadlock the child, so workers come from a single-threaded forkserver
+    chart_executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
+
+    try:
+        application.run_polling()
+    finally:
+        chart_executor.shutdown()
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -79,8 +97,8 @@ async def editors(update: Update, context: ContextTypes.DEFAULT_TYPE):
         uuid = uuid4()
         log.debug(f"Request uuid - {uuid}")
 
-        editors = get_last_7_days_data()["editors"]
-        create_pie_chart([WakatimeDataNode(editor) for editor in editors], uuid)
+        editors = (await asyncio.to_thread(get_last_7_days_data))["editors"]
+        await _create_pie_chart([WakatimeDataNode(editor) for editor in editors], uuid)
 
         _ = await _send_photo(context, update, uuid)
 
@@ -106,27 +124,20 @@ async def languages(update: Update, context: ContextTypes.DEFAULT_TYPE):
         uuid = uuid4()
         log.debug(f"Request uuid - {uuid}")
 
-        wakatime_languages_response: list[dict[str, Any]] = get_last_7_days_data()[
-            "languages"
-        ]
-        github_languages_response: list[dict[str, Any]] = get_github_languages_info()
+        wakatime_languages_response: list[dict[str, Any]] = (
+            await asyncio.to_thread(get_last_7_days_data)
+        )["languages"]
+        github_languages_colors: dict[str, str] = await asyncio.to_thread(
+            get_github_language_colors
+        )
 
         wakatime_languages_data = [
             WakatimeDataNode(language) for language in wakatime_languages_response
         ]
-        github_languages_data = [
-            GithubLanguageDataNode(language) for language in github_languages_response
-        ]
-        github_languages_data.append(
-            GithubLanguageDataNode({"name": "Vue.js", "color": "#41b883"})
-        )
-        github_languages_data.append(
-            GithubLanguageDataNode({"name": "Bash", "color": "#89e051"})
-        )
+        # resolving colors here, so only the charted ones are sent to the worker
+        colors = get_colors(github_languages_colors, wakatime_languages_data)
 
-        create_pie_chart(
-            wakatime_languages_data, uuid, langs_data=github_languages_data
-        )
+        await _create_pie_chart(wakatime_languages_data, uuid, colors=colors)
 
         _ = await _send_photo(context, update, uuid)
 
@@ -152,8 +163,10 @@ async def projects(update: Update, context: ContextTypes.DEFAULT_TYPE):
         uuid = uuid4()
         log.debug(f"Request uuid - {uuid}")
 
-        projects = get_last_7_days_data()["projects"]
-        create_pie_chart([WakatimeDataNode(project) for project in projects], uuid)
+        projects = (await asyncio.to_thread(get_last_7_days_data))["projects"]
+        await _create_pie_chart(
+            [WakatimeDataNode(project) for project in projects], uuid
+        )
 
         _ = await _send_photo(context, update, uuid)
 
@@ -172,6 +185,17 @@ async def projects(update: Update, context: ContextTypes.DEFAULT_TYPE):
         _ = await _send_error(context, update)
 
 
+async def _create_pie_chart(
+    data_list: list[WakatimeDataNode],
+    uuid: UUID,
+    colors: list[str | tuple[float, ...]] | None = None,
+):
+    loop = asyncio.get_running_loop()
+    _ = await loop.run_in_executor(
+        chart_executor, create_pie_chart, data_list, uuid, colors
+    )
+
+
 async def _send_message(
     context: ContextTypes.DEFAULT_TYPE, update: Update, message: str
 ):
@@ -182,17 +206,17 @@ async def _send_message(
 
 
 async def _send_photo(context: ContextTypes.DEFAULT_TYPE, update: Update, uuid: UUID):
-    photo_path = find_by_uuid(uuid)
+    photo_path = await asyncio.to_thread(find_by_uuid, uuid)
 
     if photo_path is None:
         raise PhotoMissingError(
             f"Unable to find photo with the following uuid - {uuid}"
         )
 
+    photo = await asyncio.to_thread(_read_photo, photo_path)
+
     log.info(f"Responding with a plot - {uuid}")
-    _ = await context.bot.send_photo(
-        chat_id=_get_chat_id(update), photo=open(photo_path, "rb")
-    )
+    _ = await context.bot.send_photo(chat_id=_get_chat_id(update), photo=photo)
 
 
 async def _send_error(context: ContextTypes.DEFAULT_TYPE, update: Update):
@@ -202,6 +226,11 @@ async def _send_error(context: ContextTypes.DEFAULT_TYPE, update: Update):
     _ = await _send_message(context, update, error_message)
 
 
+def _read_photo(photo_path: str) -> bytes:
+    with open(photo_path, "rb") as photo:
+        return photo.read()
+
+
 def _get_chat_id(update: Update) -> int:
     if update.effective_chat is None:
         raise ChatIdMissingError("Couldn't obtain chat_id fot the bot response")